@@ -0,0 +1,22 @@
+import functools
+import urllib.parse
+
+@functools.lru_cache(maxsize=256)
+def parse_path(path):
+    return urllib.parse.urlsplit(path)
+
+def get_qs_first(query, key):
+    # Only one key is ever read, so skip parse_qs and its dict-of-lists.
+    for pair in query.split('&'):
+        k, _, v = pair.partition('=')
+        if k == key:
+            return urllib.parse.unquote_plus(v)
+    return ''
+
+def response_packet(body, content_type=b'application/json'):
+    # Full pre-rendered 200 response, sent with one write and no per-request
+    # header formatting. HTTP/1.0 because the connection is closed afterwards.
+    return (
+        b'HTTP/1.0 200 OK\r\ncontent-type: %s\r\ncontent-length: %d\r\n\r\n'
+        % (content_type, len(body))
+    ) + body
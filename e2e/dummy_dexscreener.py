@@ -1,14 +1,21 @@
 import http.server
-import socketserver
-import urllib.parse
+
+from _dummy_util import get_qs_first, parse_path, response_packet
 
 PORT = 18083
 
+_EMPTY_PAIRS = b'{"schemaVersion":"1","pairs":[]}'
+_EMPTY_PAIRS_RESPONSE = response_packet(_EMPTY_PAIRS)
+
 class H(http.server.BaseHTTPRequestHandler):
+    disable_nagle_algorithm = True
+
     def do_GET(self):
         # Minimal subset
-        if self.path.startswith('/latest/dex/search'):
-            q = urllib.parse.parse_qs(urllib.parse.urlparse(self.path).query).get('q', [''])[0]
+        split = parse_path(self.path)
+        path = split.path
+        if path.startswith('/latest/dex/search'):
+            q = get_qs_first(split.query, 'q')
             self.send_response(200)
             self.send_header('content-type', 'application/json')
             self.end_headers()
@@ -17,17 +24,11 @@ class H(http.server.BaseHTTPRequestHandler):
                 % (('"%s"' % q.replace('"','')))
             ).encode('utf-8'))
             return
-        if self.path.startswith('/latest/dex/pairs/'):
-            self.send_response(200)
-            self.send_header('content-type', 'application/json')
-            self.end_headers()
-            self.wfile.write(b'{"schemaVersion":"1","pairs":[]}')
+        if path.startswith('/latest/dex/pairs/'):
+            self.wfile.write(_EMPTY_PAIRS_RESPONSE)
             return
-        if self.path.startswith('/latest/dex/tokens/'):
-            self.send_response(200)
-            self.send_header('content-type', 'application/json')
-            self.end_headers()
-            self.wfile.write(b'{"schemaVersion":"1","pairs":[]}')
+        if path.startswith('/latest/dex/tokens/'):
+            self.wfile.write(_EMPTY_PAIRS_RESPONSE)
             return
         self.send_response(404)
         self.end_headers()
@@ -36,5 +37,5 @@ class H(http.server.BaseHTTPRequestHandler):
         return
 
 if __name__ == '__main__':
-    with socketserver.TCPServer(('127.0.0.1', PORT), H) as httpd:
+    with http.server.ThreadingHTTPServer(('127.0.0.1', PORT), H) as httpd:
         httpd.serve_forever()
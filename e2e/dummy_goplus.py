@@ -1,16 +1,23 @@
 import http.server
-import socketserver
-import urllib.parse
-import json
+
+from _dummy_util import get_qs_first, parse_path
+
+try:
+    import orjson
+except ImportError:  # optional; fall back to stdlib json
+    orjson = None
+    import json
 
 PORT = 18087
 
 class H(http.server.BaseHTTPRequestHandler):
+    disable_nagle_algorithm = True
+
     def do_GET(self):
-        if self.path.startswith('/api/v1/token_security/'):
-            chain_id = self.path.split('/api/v1/token_security/', 1)[1].split('?', 1)[0]
-            qs = urllib.parse.parse_qs(urllib.parse.urlparse(self.path).query)
-            addrs = qs.get('contract_addresses', [''])[0]
+        split = parse_path(self.path)
+        if split.path.startswith('/api/v1/token_security/'):
+            chain_id = split.path.split('/api/v1/token_security/', 1)[1]
+            addrs = get_qs_first(split.query, 'contract_addresses')
             self.send_response(200)
             self.send_header('content-type', 'application/json')
             self.end_headers()
@@ -25,7 +32,10 @@ class H(http.server.BaseHTTPRequestHandler):
                     }
                 }
             }
-            self.wfile.write(json.dumps(body).encode('utf-8'))
+            if orjson is not None:
+                self.wfile.write(orjson.dumps(body))
+            else:
+                self.wfile.write(json.dumps(body).encode('utf-8'))
             return
         self.send_response(404)
         self.end_headers()
@@ -34,5 +44,5 @@ class H(http.server.BaseHTTPRequestHandler):
         return
 
 if __name__ == '__main__':
-    with socketserver.TCPServer(('127.0.0.1', PORT), H) as httpd:
+    with http.server.ThreadingHTTPServer(('127.0.0.1', PORT), H) as httpd:
         httpd.serve_forever()
@@ -1,24 +1,51 @@
 import http.server
-import socketserver
-import json
 import urllib.parse
 
+from _dummy_util import parse_path
+
+try:
+    import orjson
+except ImportError:  # optional; fall back to stdlib json
+    orjson = None
+    import json
+
 PORT = 18081
 
 
+# Action endpoints that all just acknowledge with {"ok": true}.
+_OK_ACTIONS = frozenset({
+    "dismiss",
+    "execute",
+    "preflight",
+    "mark-executing",
+    "mark-executed",
+    "cancel",
+    "fill",
+    "settle",
+})
+_OK_BODY = b'{"ok":true}'
+
+
 def _json(w, status, obj):
     w.send_response(status)
     w.send_header("content-type", "application/json")
     w.end_headers()
-    w.wfile.write(json.dumps(obj).encode("utf-8"))
+    if orjson is not None:
+        w.wfile.write(orjson.dumps(obj))
+    else:
+        w.wfile.write(json.dumps(obj).encode("utf-8"))
 
 
 class H(http.server.BaseHTTPRequestHandler):
+    disable_nagle_algorithm = True
+
     def do_GET(self):
-        if self.path == "/healthz":
+        split = parse_path(self.path)
+        path = split.path
+        if path == "/healthz":
             _json(self, 200, {"status": "ok"})
             return
-        if self.path == "/docs":
+        if path == "/docs":
             self.send_response(200)
             self.send_header("content-type", "text/markdown; charset=utf-8")
             self.end_headers()
@@ -28,8 +55,8 @@ class H(http.server.BaseHTTPRequestHandler):
             return
 
         # Minimal subset to support cli integration smoke.
-        if self.path.startswith("/api/v2/opportunities"):
-            qs = urllib.parse.parse_qs(urllib.parse.urlparse(self.path).query)
+        if path.startswith("/api/v2/opportunities"):
+            qs = urllib.parse.parse_qs(split.query)
             limit = int(qs.get("limit", ["50"])[0])
             _json(
                 self,
@@ -48,15 +75,15 @@ class H(http.server.BaseHTTPRequestHandler):
             )
             return
 
-        if self.path.startswith("/api/v2/executions"):
+        if path.startswith("/api/v2/executions"):
             _json(self, 200, {"items": [], "next_offset": 0})
             return
 
-        if self.path.startswith("/api/catalog/events"):
+        if path.startswith("/api/catalog/events"):
             _json(self, 200, {"items": [], "next_offset": 0})
             return
 
-        if self.path.startswith("/api/catalog/markets"):
+        if path.startswith("/api/catalog/markets"):
             _json(self, 200, {"items": [], "next_offset": 0})
             return
 
@@ -65,20 +92,12 @@ class H(http.server.BaseHTTPRequestHandler):
 
     def do_POST(self):
         # Minimal subset to support cli integration smoke.
-        if self.path.startswith("/api/catalog/sync"):
-            _json(self, 200, {"ok": True})
-            return
-        if self.path.endswith("/dismiss") or self.path.endswith("/execute"):
-            _json(self, 200, {"ok": True})
-            return
-        if self.path.endswith("/preflight"):
-            _json(self, 200, {"ok": True})
-            return
-        if self.path.endswith("/mark-executing") or self.path.endswith("/mark-executed") or self.path.endswith("/cancel"):
-            _json(self, 200, {"ok": True})
-            return
-        if self.path.endswith("/fill") or self.path.endswith("/settle"):
-            _json(self, 200, {"ok": True})
+        path = parse_path(self.path).path
+        if path.startswith("/api/catalog/sync") or path.rsplit("/", 1)[-1] in _OK_ACTIONS:
+            self.send_response(200)
+            self.send_header("content-type", "application/json")
+            self.end_headers()
+            self.wfile.write(_OK_BODY)
             return
 
         self.send_response(404)
@@ -89,5 +108,5 @@ class H(http.server.BaseHTTPRequestHandler):
 
 
 if __name__ == "__main__":
-    with socketserver.TCPServer(("127.0.0.1", PORT), H) as httpd:
+    with http.server.ThreadingHTTPServer(("127.0.0.1", PORT), H) as httpd:
         httpd.serve_forever()
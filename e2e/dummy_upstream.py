@@ -1,28 +1,37 @@
-import http.server
-import socketserver
+import asyncio
+
+from _dummy_util import response_packet
 
 PORT = 18081
 
-class H(http.server.BaseHTTPRequestHandler):
-    def do_GET(self):
-        if self.path == '/health':
-            self.send_response(200)
-            self.send_header('content-type', 'application/json')
-            self.end_headers()
-            self.wfile.write(b'{"status":"ok"}')
-            return
-        if self.path == '/docs':
-            self.send_response(200)
-            self.send_header('content-type', 'text/markdown; charset=utf-8')
-            self.end_headers()
-            self.wfile.write(b'# Dummy Meme Service\n\n- GET /health\n')
-            return
-        self.send_response(404)
-        self.end_headers()
+_HEALTH = b'{"status":"ok"}'
+_HEALTH_RESPONSE = response_packet(_HEALTH)
+_DOCS = b'# Dummy Meme Service\n\n- GET /health\n'
+_DOCS_RESPONSE = response_packet(_DOCS, b'text/markdown; charset=utf-8')
+_NOT_FOUND_RESPONSE = b'HTTP/1.0 404 Not Found\r\ncontent-length: 0\r\n\r\n'
+
+_ROUTES = {
+    (b'GET', b'/health'): _HEALTH_RESPONSE,
+    (b'GET', b'/docs'): _DOCS_RESPONSE,
+}
+
+# Every response is static, so skip http.server entirely: read the request
+# head, look the route up and write the prebuilt bytes.
+async def handle(reader, writer):
+    try:
+        head = await reader.readuntil(b'\r\n\r\n')
+        method, path, _ = head.split(b'\r\n', 1)[0].split(b' ', 2)
+        writer.write(_ROUTES.get((method, path), _NOT_FOUND_RESPONSE))
+        await writer.drain()
+    except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ValueError, ConnectionError):
+        pass
+    finally:
+        writer.close()
 
-    def log_message(self, format, *args):
-        return
+async def main():
+    server = await asyncio.start_server(handle, '127.0.0.1', PORT)
+    async with server:
+        await server.serve_forever()
 
 if __name__ == '__main__':
-    with socketserver.TCPServer(('127.0.0.1', PORT), H) as httpd:
-        httpd.serve_forever()
+    asyncio.run(main())
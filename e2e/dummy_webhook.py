@@ -1,19 +1,41 @@
-import http.server
-import socketserver
+import asyncio
+
+from _dummy_util import response_packet
 
 PORT = 18082
 
-class H(http.server.BaseHTTPRequestHandler):
-    def do_POST(self):
-        # accept any payload
-        self.send_response(200)
-        self.send_header('content-type', 'application/json')
-        self.end_headers()
-        self.wfile.write(b'{"ok":true}')
+_OK = b'{"ok":true}'
+_OK_RESPONSE = response_packet(_OK)
+_NOT_ALLOWED_RESPONSE = b'HTTP/1.0 405 Method Not Allowed\r\ncontent-length: 0\r\n\r\n'
+
+def _header(head, name):
+    for line in head.split(b'\r\n')[1:]:
+        key, _, value = line.partition(b':')
+        if key.strip().lower() == name:
+            return value.strip()
+    return b''
+
+# The response never depends on the request, so skip http.server entirely:
+# read the head, drain the body and write the prebuilt bytes.
+async def handle(reader, writer):
+    try:
+        head = await reader.readuntil(b'\r\n\r\n')
+        method = head.split(b' ', 1)[0]
+        # accept any payload; clients sending Expect wait for 100 before the body
+        if _header(head, b'expect').lower() == b'100-continue':
+            writer.write(b'HTTP/1.1 100 Continue\r\n\r\n')
+        await reader.readexactly(int(_header(head, b'content-length') or 0))
+        writer.write(_OK_RESPONSE if method == b'POST' else _NOT_ALLOWED_RESPONSE)
+        await writer.drain()
+    except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ValueError, ConnectionError):
+        pass
+    finally:
+        writer.close()
 
-    def log_message(self, format, *args):
-        return
+async def main():
+    server = await asyncio.start_server(handle, '127.0.0.1', PORT)
+    async with server:
+        await server.serve_forever()
 
 if __name__ == '__main__':
-    with socketserver.TCPServer(('127.0.0.1', PORT), H) as httpd:
-        httpd.serve_forever()
+    asyncio.run(main())
@@ -2,36 +2,197 @@
 """
 X Tweet Fetcher - Fetch tweets from X/Twitter without login or API keys.
 Uses FxTwitter API only. Zero dependencies, zero configuration.
+Uses orjson for faster JSON handling, msgspec for schema-guided response
+decoding and urllib3 for connection pooling with retries when they are
+installed.
 """
 
 import json
-import re
 import sys
 import argparse
 import time
+import random
+import base64
+import http.client
+import urllib.parse
 import urllib.request
-import urllib.error
-from typing import Optional, Dict, Any
+from typing import AbstractSet, Optional, Dict, Any, Tuple
+
+try:
+    import orjson
+except ImportError:  # optional; stay zero-dependency without it
+    orjson = None
+
+try:
+    import urllib3
+except ImportError:  # optional; falls back to a single http.client connection
+    urllib3 = None
+
+try:
+    import msgspec
+except ImportError:  # optional; responses are decoded untyped without it
+    msgspec = None
+
+
+def _json_loads(raw: bytes) -> Any:
+    """Decode a JSON response body straight from bytes, without an intermediate str."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+if msgspec is not None:
+    from typing import List, TypedDict
+
+    # Schema of the FxTwitter fields this script reads. Decoding against it
+    # lets msgspec skip every other key instead of building dicts for them;
+    # leaves stay Any so unexpected value types still decode as they would
+    # with json.loads.
+    class _Author(TypedDict, total=False):
+        name: Any
+        screen_name: Any
+
+    class _MediaItem(TypedDict, total=False):
+        type: Any
+        url: Any
+        width: Any
+        height: Any
+
+    class _Variant(TypedDict, total=False):
+        url: Any
+        bitrate: Any
+        content_type: Any
+
+    class _Video(TypedDict, total=False):
+        url: Any
+        duration: Any
+        thumbnail_url: Any
+        variants: Optional[List[_Variant]]
+
+    class _Media(TypedDict, total=False):
+        all: Optional[List[_MediaItem]]
+        videos: Optional[List[_Video]]
+
+    class _Block(TypedDict, total=False):
+        text: Any
+
+    class _ArticleContent(TypedDict, total=False):
+        blocks: Optional[List[_Block]]
+
+    class _Article(TypedDict, total=False):
+        title: Any
+        preview_text: Any
+        created_at: Any
+        content: Optional[_ArticleContent]
+
+    class _QuoteTweet(TypedDict, total=False):
+        text: Any
+        author: Optional[_Author]
+        likes: Any
+        retweets: Any
+        views: Any
+        media: Optional[_Media]
+
+    class _Tweet(_QuoteTweet, total=False):
+        bookmarks: Any
+        replies: Any
+        created_at: Any
+        is_note_tweet: Any
+        lang: Any
+        quote: Optional[_QuoteTweet]
+        article: Optional[_Article]
+
+    class _Envelope(TypedDict, total=False):
+        code: Any
+        message: Any
+        tweet: Optional[_Tweet]
+
+    _RESPONSE_DECODER = msgspec.json.Decoder(_Envelope)
+
+
+def _decode_response(raw: bytes) -> Dict[str, Any]:
+    """Decode an FxTwitter response body, keeping only the fields we read."""
+    if msgspec is not None:
+        try:
+            return _RESPONSE_DECODER.decode(raw)
+        except msgspec.ValidationError:
+            # Valid JSON in an unexpected shape; let the caller see it untyped
+            pass
+    return _json_loads(raw)
+
+
+def _write_json(stream, obj: Any, pretty: bool = False) -> None:
+    """Write obj as UTF-8 JSON plus a newline straight to stream's byte buffer."""
+    if orjson is not None:
+        # orjson always emits UTF-8, so there is no ensure_ascii escaping pass
+        option = orjson.OPT_APPEND_NEWLINE | (orjson.OPT_INDENT_2 if pretty else 0)
+        data = orjson.dumps(obj, option=option)
+    else:
+        data = (json.dumps(obj, ensure_ascii=False, indent=2 if pretty else None) + "\n").encode("utf-8")
+    stream.buffer.write(data)
+
+
+API_HOST = "api.fxtwitter.com"
+_HEADERS = {"User-Agent": "Mozilla/5.0"}
+
+# Retry policy: exponential backoff (0.25s, 0.5s, ...) on network errors
+# and transient gateway statuses
+MAX_RETRIES = 2
+BACKOFF_FACTOR = 0.25
+RETRY_STATUSES = frozenset({502, 503, 504})
+
+_NETWORK_ERRORS: Tuple[type, ...] = (http.client.HTTPException, OSError)
+if urllib3 is not None:
+    _NETWORK_ERRORS += (urllib3.exceptions.HTTPError,)
+
+
+def _https_proxy() -> Optional[str]:
+    """Proxy URL for API_HOST from HTTPS_PROXY/NO_PROXY, as urllib.request resolves it."""
+    proxy = urllib.request.getproxies().get("https")
+    if not proxy or urllib.request.proxy_bypass(API_HOST):
+        return None
+    return proxy if "://" in proxy else "http://" + proxy
+
+
+def _proxy_headers(proxy_url: str) -> Dict[str, str]:
+    """Proxy-Authorization header for credentials embedded in proxy_url."""
+    proxy = urllib.parse.urlsplit(proxy_url)
+    if not proxy.username:
+        return {}
+    creds = f"{urllib.parse.unquote(proxy.username)}:{urllib.parse.unquote(proxy.password or '')}"
+    return {"Proxy-Authorization": "Basic " + base64.b64encode(creds.encode()).decode("ascii")}
+
+
+def _backoff(attempt: int) -> None:
+    """Sleep before retry number attempt + 1, with jitter."""
+    delay = BACKOFF_FACTOR * (2 ** attempt)
+    time.sleep(delay + random.uniform(0, delay))
+
+
+# Optional tweet sections needed by --text-only output (no media or quote)
+TEXT_ONLY_FIELDS = frozenset({"article"})
+
+_TWEET_HOSTS = ("x.com", "twitter.com")
 
 
 def parse_tweet_url(url: str) -> tuple:
     """Extract username and tweet_id from X/Twitter URL."""
-    patterns = [
-        r'(?:x\.com|twitter\.com)/([a-zA-Z0-9_]{1,15})/status/(\d+)',
-    ]
-    for pattern in patterns:
-        match = re.search(pattern, url)
-        if match:
-            username = match.group(1)
-            tweet_id = match.group(2)
-            # Validate username: 1-15 alphanumeric/underscore chars
-            if not re.match(r'^[a-zA-Z0-9_]{1,15}$', username):
-                raise ValueError(f"Invalid username format: {username}")
-            # Validate tweet_id: numeric only
-            if not tweet_id.isdigit():
-                raise ValueError(f"Invalid tweet ID format: {tweet_id}")
-            return username, tweet_id
-    raise ValueError(f"Cannot parse tweet URL: {url}")
+    # Plain string scans only; no regex engine on this path
+    host_path, sep, rest = url.partition("/status/")
+    if not sep:
+        raise ValueError(f"Cannot parse tweet URL: {url}")
+    host, _, username = host_path.rpartition("/")
+    if not host.endswith(_TWEET_HOSTS):
+        raise ValueError(f"Cannot parse tweet URL: {url}")
+    # Validate username: 1-15 ASCII alphanumeric/underscore chars. Mapping "_"
+    # to a letter lets isalnum() check the whole name without a regex.
+    if not (1 <= len(username) <= 15 and username.isascii() and username.replace("_", "a").isalnum()):
+        raise ValueError(f"Invalid username format: {username}")
+    # Validate tweet_id: numeric only, ignoring any query/fragment/trailing path
+    tweet_id = rest.split("?", 1)[0].split("#", 1)[0].split("/", 1)[0]
+    if not (tweet_id.isascii() and tweet_id.isdigit()):
+        raise ValueError(f"Invalid tweet ID format: {tweet_id}")
+    return username, tweet_id
 
 
 def extract_media(tweet_obj: Dict[str, Any]) -> Optional[Dict[str, Any]]:
@@ -49,38 +210,43 @@ def extract_media(tweet_obj: Dict[str, Any]) -> Optional[Dict[str, Any]]:
             media_data["images"] = []
             for photo in photos:
                 image_info = {"url": photo.get("url", "")}
-                if photo.get("width"):
-                    image_info["width"] = photo.get("width")
-                if photo.get("height"):
-                    image_info["height"] = photo.get("height")
+                width = photo.get("width")
+                if width:
+                    image_info["width"] = width
+                height = photo.get("height")
+                if height:
+                    image_info["height"] = height
                 media_data["images"].append(image_info)
 
     # Extract videos from media.videos
     videos = media.get("videos", [])
-    if videos and isinstance(videos, list) and len(videos) > 0:
+    if videos and isinstance(videos, list):
         media_data["videos"] = []
         for video in videos:
-            video_info = {}
-            # Get highest quality video URL
-            if video.get("url"):
-                video_info["url"] = video.get("url")
-            # Duration in seconds
-            if video.get("duration"):
-                video_info["duration"] = video.get("duration")
-            # Thumbnail
-            if video.get("thumbnail_url"):
-                video_info["thumbnail"] = video.get("thumbnail_url")
+            # Highest quality URL, duration in seconds, thumbnail; falsy values are omitted
+            video_info = {
+                key: value
+                for key, value in (
+                    ("url", video.get("url")),
+                    ("duration", video.get("duration")),
+                    ("thumbnail", video.get("thumbnail_url")),
+                )
+                if value
+            }
             # Available variants/bitrates
-            if video.get("variants") and isinstance(video.get("variants"), list):
+            variants = video.get("variants")
+            if variants and isinstance(variants, list):
                 video_info["variants"] = []
-                for variant in video.get("variants", []):
-                    variant_info = {}
-                    if variant.get("url"):
-                        variant_info["url"] = variant.get("url")
-                    if variant.get("bitrate"):
-                        variant_info["bitrate"] = variant.get("bitrate")
-                    if variant.get("content_type"):
-                        variant_info["content_type"] = variant.get("content_type")
+                for variant in variants:
+                    variant_info = {
+                        key: value
+                        for key, value in (
+                            ("url", variant.get("url")),
+                            ("bitrate", variant.get("bitrate")),
+                            ("content_type", variant.get("content_type")),
+                        )
+                        if value
+                    }
                     if variant_info:
                         video_info["variants"].append(variant_info)
             if video_info:
@@ -89,109 +255,231 @@ def extract_media(tweet_obj: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     return media_data if media_data else None
 
 
-def fetch_tweet(url: str, timeout: int = 30) -> Dict[str, Any]:
-    """Fetch tweet text, stats, quotes, and full article content via FxTwitter API."""
-    username, tweet_id = parse_tweet_url(url)
-    result = {"url": url, "username": username, "tweet_id": tweet_id}
+def _build_tweet_data(tweet: Dict[str, Any], fields: Optional[AbstractSet[str]] = None) -> Dict[str, Any]:
+    """Convert an FxTwitter tweet object into the output tweet dict.
 
-    api_url = f"https://api.fxtwitter.com/{username}/status/{tweet_id}"
+    fields limits which optional sections ("media", "quote", "article") are
+    built; None builds all of them.
+    """
+    tweet_data = {
+        "text": tweet.get("text", ""),
+        "author": tweet.get("author", {}).get("name", ""),
+        "screen_name": tweet.get("author", {}).get("screen_name", ""),
+        "likes": tweet.get("likes", 0),
+        "retweets": tweet.get("retweets", 0),
+        "bookmarks": tweet.get("bookmarks", 0),
+        "views": tweet.get("views", 0),
+        "replies_count": tweet.get("replies", 0),
+        "created_at": tweet.get("created_at", ""),
+        "is_note_tweet": tweet.get("is_note_tweet", False),
+        "lang": tweet.get("lang", ""),
+    }
 
-    # Retry once on network failure
-    max_attempts = 2
-    for attempt in range(max_attempts):
-        try:
-            req = urllib.request.Request(api_url, headers={"User-Agent": "Mozilla/5.0"})
-            with urllib.request.urlopen(req, timeout=timeout) as resp:
-                data = json.loads(resp.read().decode())
+    want_media = fields is None or "media" in fields
 
-            if data.get("code") != 200:
-                result["error"] = f"FxTwitter returned code {data.get('code')}: {data.get('message', 'Unknown')}"
-                return result
+    # Extract media if present
+    if want_media:
+        media = extract_media(tweet)
+        if media:
+            tweet_data["media"] = media
 
-            tweet = data["tweet"]
-            tweet_data = {
-                "text": tweet.get("text", ""),
-                "author": tweet.get("author", {}).get("name", ""),
-                "screen_name": tweet.get("author", {}).get("screen_name", ""),
-                "likes": tweet.get("likes", 0),
-                "retweets": tweet.get("retweets", 0),
-                "bookmarks": tweet.get("bookmarks", 0),
-                "views": tweet.get("views", 0),
-                "replies_count": tweet.get("replies", 0),
-                "created_at": tweet.get("created_at", ""),
-                "is_note_tweet": tweet.get("is_note_tweet", False),
-                "lang": tweet.get("lang", ""),
-            }
+    # Include quote tweet if present
+    if (fields is None or "quote" in fields) and tweet.get("quote"):
+        qt = tweet["quote"]
+        tweet_data["quote"] = {
+            "text": qt.get("text", ""),
+            "author": qt.get("author", {}).get("name", ""),
+            "screen_name": qt.get("author", {}).get("screen_name", ""),
+            "likes": qt.get("likes", 0),
+            "retweets": qt.get("retweets", 0),
+            "views": qt.get("views", 0),
+        }
+        # Extract media from quote tweet
+        if want_media:
+            quote_media = extract_media(qt)
+            if quote_media:
+                tweet_data["quote"]["media"] = quote_media
 
-            # Extract media if present
-            media = extract_media(tweet)
-            if media:
-                tweet_data["media"] = media
-
-            # Include quote tweet if present
-            if tweet.get("quote"):
-                qt = tweet["quote"]
-                tweet_data["quote"] = {
-                    "text": qt.get("text", ""),
-                    "author": qt.get("author", {}).get("name", ""),
-                    "screen_name": qt.get("author", {}).get("screen_name", ""),
-                    "likes": qt.get("likes", 0),
-                    "retweets": qt.get("retweets", 0),
-                    "views": qt.get("views", 0),
-                }
-                # Extract media from quote tweet
-                quote_media = extract_media(qt)
-                if quote_media:
-                    tweet_data["quote"]["media"] = quote_media
-
-            # Extract X Article (long-form content) if present
-            article = tweet.get("article")
-            if article:
-                article_data = {
-                    "title": article.get("title", ""),
-                    "preview_text": article.get("preview_text", ""),
-                    "created_at": article.get("created_at", ""),
-                }
-                content = article.get("content", {})
-                blocks = content.get("blocks", [])
-                if blocks:
-                    full_text = "\n\n".join(
-                        b.get("text", "") for b in blocks if b.get("text", "")
-                    )
-                    article_data["full_text"] = full_text
-                    article_data["word_count"] = len(full_text.split())
-                    article_data["char_count"] = len(full_text)
-                tweet_data["article"] = article_data
-                tweet_data["is_article"] = True
+    # Extract X Article (long-form content) if present
+    article = tweet.get("article")
+    if article and (fields is None or "article" in fields):
+        article_data = {
+            "title": article.get("title", ""),
+            "preview_text": article.get("preview_text", ""),
+            "created_at": article.get("created_at", ""),
+        }
+        content = article.get("content", {})
+        blocks = content.get("blocks", [])
+        if blocks:
+            texts = [text for text in (b.get("text", "") for b in blocks) if text]
+            full_text = "\n\n".join(texts)
+            article_data["full_text"] = full_text
+            article_data["word_count"] = len(full_text.split())
+            article_data["char_count"] = len(full_text)
+        tweet_data["article"] = article_data
+    tweet_data["is_article"] = bool(article)
+
+    return tweet_data
+
+
+class TweetFetcher:
+    """Fetch tweets over reusable HTTPS connections to the FxTwitter API.
+
+    Reusing connections means only the first request pays for the TCP and
+    TLS handshake, which dominates wall time when fetching many tweets.
+    With urllib3 installed, a connection pool with urllib3's Retry handles
+    keep-alive and backoff; otherwise a single http.client connection is
+    reused and retried here.
+    """
+
+    def __init__(self, timeout: int = 30):
+        self.timeout = timeout
+        self._proxy = _https_proxy()
+        self._conn: Optional[http.client.HTTPSConnection] = None
+        self._pool = None
+        # Direct pools take a path; the proxy manager needs the absolute URL
+        self._url_prefix = ""
+        if urllib3 is not None:
+            pool_kw = dict(
+                maxsize=8,
+                timeout=timeout,
+                retries=urllib3.Retry(
+                    total=MAX_RETRIES,
+                    backoff_factor=BACKOFF_FACTOR,
+                    status_forcelist=RETRY_STATUSES,
+                    raise_on_status=False,
+                ),
+            )
+            if self._proxy is None:
+                self._pool = urllib3.HTTPSConnectionPool(API_HOST, **pool_kw)
             else:
-                tweet_data["is_article"] = False
+                # urllib3 pools ignore proxy env vars, so route through the proxy explicitly
+                self._pool = urllib3.ProxyManager(
+                    self._proxy, proxy_headers=_proxy_headers(self._proxy), **pool_kw
+                )
+                self._url_prefix = f"https://{API_HOST}"
+
+    def __enter__(self) -> "TweetFetcher":
+        return self
 
-            result["tweet"] = tweet_data
-            return result
+    def __exit__(self, *exc) -> None:
+        self.close()
 
-        except urllib.error.URLError as e:
-            # Retry on network errors
-            if attempt < max_attempts - 1:
-                time.sleep(1)  # Short delay before retry
-                continue
+    def close(self) -> None:
+        if self._pool is not None:
+            if isinstance(self._pool, urllib3.ProxyManager):
+                self._pool.clear()
             else:
-                result["error"] = "Network error: Failed to fetch tweet after retry"
+                self._pool.close()
+        self._reset()
+
+    def _reset(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _connect(self) -> http.client.HTTPSConnection:
+        if self._proxy is None:
+            return http.client.HTTPSConnection(API_HOST, timeout=self.timeout)
+        # CONNECT tunnel through the proxy, like urllib.request's ProxyHandler
+        proxy = urllib.parse.urlsplit(self._proxy)
+        conn = http.client.HTTPSConnection(proxy.hostname, proxy.port, timeout=self.timeout)
+        conn.set_tunnel(API_HOST, 443, headers=_proxy_headers(self._proxy))
+        return conn
+
+    def _get(self, path: str) -> Tuple[int, str, bytes]:
+        if self._pool is not None:
+            resp = self._pool.request("GET", self._url_prefix + path, headers=_HEADERS, redirect=False)
+            return resp.status, resp.reason, resp.data
+        if self._conn is None:
+            self._conn = self._connect()
+        self._conn.request("GET", path, headers=_HEADERS)
+        resp = self._conn.getresponse()
+        return resp.status, resp.reason, resp.read()
+
+    def fetch(self, url: str, fields: Optional[AbstractSet[str]] = None) -> Dict[str, Any]:
+        """Fetch tweet text, stats, quotes, and full article content via FxTwitter API.
+
+        Pass fields (e.g. TEXT_ONLY_FIELDS) to skip building unused sections.
+        """
+        username, tweet_id = parse_tweet_url(url)
+        result = {"url": url, "username": username, "tweet_id": tweet_id}
+
+        # urllib3's Retry already retries inside the pool; otherwise retry here
+        max_attempts = 1 if self._pool is not None else MAX_RETRIES + 1
+        for attempt in range(max_attempts):
+            try:
+                status, reason, body = self._get(f"/{username}/status/{tweet_id}")
+                if status in RETRY_STATUSES and attempt < max_attempts - 1:
+                    _backoff(attempt)
+                    continue
+                # Redirects are not followed; report them instead of parsing the body
+                if status >= 300:
+                    result["error"] = f"HTTP {status}: {reason}"
+                    return result
+                try:
+                    data = _decode_response(body)
+                except ValueError:
+                    # Bad UTF-8 or malformed JSON won't improve on retry
+                    result["error"] = "Invalid response from FxTwitter: body is not valid UTF-8 JSON"
+                    return result
+
+                if data.get("code") != 200:
+                    result["error"] = f"FxTwitter returned code {data.get('code')}: {data.get('message', 'Unknown')}"
+                    return result
+
+                result["tweet"] = _build_tweet_data(data["tweet"], fields)
+                return result
+
+            except _NETWORK_ERRORS:
+                # Drop the (possibly stale) connection so the retry reconnects
+                self._reset()
+                # Retry on network errors
+                if attempt < max_attempts - 1:
+                    _backoff(attempt)
+                    continue
+                else:
+                    result["error"] = "Network error: Failed to fetch tweet after retry"
+                    return result
+            except Exception:
+                result["error"] = "An unexpected error occurred while fetching the tweet"
                 return result
-        except urllib.error.HTTPError as e:
-            result["error"] = f"HTTP {e.code}: {e.reason}"
-            return result
-        except Exception as e:
-            result["error"] = f"An unexpected error occurred while fetching the tweet"
-            return result
 
-    return result
+        return result
+
+
+def fetch_tweet(url: str, timeout: int = 30, fields: Optional[AbstractSet[str]] = None) -> Dict[str, Any]:
+    """Fetch a single tweet. Use TweetFetcher directly to fetch many over reused connections."""
+    with TweetFetcher(timeout=timeout) as fetcher:
+        return fetcher.fetch(url, fields)
+
+
+def _print_text(result: Dict[str, Any]) -> bool:
+    """Print a human readable tweet. Returns False if there was nothing to print."""
+    tweet = result.get("tweet", {})
+    if tweet.get("is_article") and tweet.get("article", {}).get("full_text"):
+        article = tweet["article"]
+        print(f"# {article['title']}\n")
+        print(f"By @{tweet['screen_name']} | {tweet.get('created_at', '')}")
+        print(f"Likes: {tweet['likes']} | Retweets: {tweet['retweets']} | Views: {tweet['views']}")
+        print(f"Words: {article['word_count']}\n")
+        print(article["full_text"])
+    elif tweet.get("text"):
+        print(f"@{tweet['screen_name']}: {tweet['text']}")
+        print(f"\nLikes: {tweet['likes']} | Retweets: {tweet['retweets']} | Views: {tweet['views']}")
+    elif result.get("error"):
+        print(f"Error: {result['error']}", file=sys.stderr)
+        return False
+    return True
 
 
 def main():
     parser = argparse.ArgumentParser(
         description="Fetch tweets from X/Twitter without login or API keys"
     )
-    parser.add_argument("--url", "-u", required=True, help="Tweet URL (x.com or twitter.com)")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--url", "-u", help="Tweet URL (x.com or twitter.com)")
+    source.add_argument("--url-file", "-f", help="File with one tweet URL per line; all are fetched over one connection")
     parser.add_argument("--pretty", "-p", action="store_true", help="Pretty print JSON")
     parser.add_argument("--text-only", "-t", action="store_true", help="Print only tweet text (or article full text)")
     parser.add_argument("--timeout", type=int, default=30, help="Request timeout in seconds (default: 30)")
@@ -200,35 +488,40 @@ def main():
     args = parser.parse_args()
 
     if args.replies:
-        print(json.dumps({
+        _write_json(sys.stderr, {
             "error": "Reply fetching not currently supported",
             "reason": "FxTwitter API does not provide reply content. Reply fetching would require browser automation dependencies (Camofox/Nitter) which were removed to maintain zero-dependency architecture.",
             "workaround": "The tweet's reply count is included in the standard output as 'replies_count'",
             "future": "This feature may be re-implemented as an optional dependency in a future version"
-        }, indent=2 if args.pretty else None), file=sys.stderr)
+        }, pretty=args.pretty)
         sys.exit(1)
 
-    result = fetch_tweet(args.url, timeout=args.timeout)
-
-    if args.text_only:
-        tweet = result.get("tweet", {})
-        if tweet.get("is_article") and tweet.get("article", {}).get("full_text"):
-            article = tweet["article"]
-            print(f"# {article['title']}\n")
-            print(f"By @{tweet['screen_name']} | {tweet.get('created_at', '')}")
-            print(f"Likes: {tweet['likes']} | Retweets: {tweet['retweets']} | Views: {tweet['views']}")
-            print(f"Words: {article['word_count']}\n")
-            print(article["full_text"])
-        elif tweet.get("text"):
-            print(f"@{tweet['screen_name']}: {tweet['text']}")
-            print(f"\nLikes: {tweet['likes']} | Retweets: {tweet['retweets']} | Views: {tweet['views']}")
-        elif result.get("error"):
-            print(f"Error: {result['error']}", file=sys.stderr)
-            sys.exit(1)
+    if args.url_file:
+        with open(args.url_file, encoding="utf-8") as f:
+            urls = [line.strip() for line in f if line.strip() and not line.startswith("#")]
     else:
-        indent = 2 if args.pretty else None
-        print(json.dumps(result, ensure_ascii=False, indent=indent))
+        urls = [args.url]
 
+    ok = True
+    with TweetFetcher(timeout=args.timeout) as fetcher:
+        for i, url in enumerate(urls):
+            try:
+                result = fetcher.fetch(url, TEXT_ONLY_FIELDS if args.text_only else None)
+            except ValueError as e:
+                # Bad URLs in a batch are reported per entry instead of aborting the run
+                if not args.url_file:
+                    raise
+                result = {"url": url, "error": str(e)}
+
+            if args.text_only:
+                if i > 0:
+                    print()
+                ok = _print_text(result) and ok
+            else:
+                _write_json(sys.stdout, result, pretty=args.pretty)
+
+    if not ok:
+        sys.exit(1)
 
 if __name__ == "__main__":
     main()